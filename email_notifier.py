@@ -1,7 +1,84 @@
+import functools
+import logging
+import re
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from datetime import datetime
+import sys
+import time
+import aiosmtplib
+from email import policy
+from email.message import EmailMessage
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for a NOOP reply when health-checking a cached connection
+_NOOP_TIMEOUT = 0.5
+
+# Line classification rules for the HTML body, compiled once.
+# Group order matches rule priority: indented details win over titles.
+_LINE_RE = re.compile(
+    r'(?P<date>Date:)'
+    r'|(?P<loc>Location:)'
+    r'|(?P<ind>  |Region:|Municipality:|Time:)'
+    r'|\s*(?P<title>PLANNED|SUMMARY)'
+)
+
+# Markers that make a message worth an HTML alternative part
+_HTML_MARKERS = ('Date:', 'Location:', '===', 'PLANNED', 'SUMMARY')
+
+_LINE_TEMPLATES = {
+    'date': '<h2 style="color: #d32f2f;">{}</h2>',
+    'loc': '<p style="margin: 5px 0;"><strong>{}</strong></p>',
+    'ind': '<p style="margin: 2px 0 2px 20px; color: #555;">{}</p>',
+    'title': '<h1 style="color: #1976d2;">{}</h1>',
+    'text': '<p style="margin: 5px 0;">{}</p>',
+}
+
+
+def _format_line(line):
+    """
+    Converts a single plain text line to its HTML fragment.
+
+    Args:
+        line: Line of the plain text message
+
+    Returns:
+        str: HTML fragment for the line
+    """
+    if '===' in line:
+        # Horizontal rule
+        return '<hr/>'
+
+    match = _LINE_RE.match(line)
+    if match:
+        return _LINE_TEMPLATES[match.lastgroup].format(line)
+
+    if line.strip():
+        # Regular text
+        return _LINE_TEMPLATES['text'].format(line)
+
+    # Empty line
+    return '<br/>'
+
+
+@functools.lru_cache(maxsize=8)
+def _plain_to_html(plain_text):
+    """
+    Converts plain text message to HTML with basic formatting.
+
+    Cached so the same message sent repeatedly is only formatted once.
+
+    Args:
+        plain_text: Plain text message
+
+    Returns:
+        str: HTML formatted message
+    """
+    return (
+        '<html><body style="font-family: Arial, sans-serif;">'
+        + ''.join(map(_format_line, plain_text.split('\n')))
+        + '</body></html>'
+    )
 
 
 class EmailNotifier:
@@ -23,10 +100,169 @@ class EmailNotifier:
         self.smtp_port = smtp_port
         self.sender_email = sender_email
         self.sender_password = sender_password
+        self._server = None
+        self._async_server = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    def close(self):
+        """
+        Closes the cached SMTP connection, if one is open.
+        """
+        if self._server is None:
+            return
+
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            self._server.close()
+        finally:
+            self._server = None
+
+    def _ensure_connection(self):
+        """
+        Returns a live SMTP connection, opening and logging in only when needed.
+
+        The connection is cached so that TLS handshake and AUTH are paid once
+        per notifier instead of once per email.
+
+        Returns:
+            smtplib.SMTP: Connected and authenticated SMTP session
+        """
+        if self._server is not None:
+            if self._alive():
+                return self._server
+
+            logger.info("Cached SMTP connection is no longer usable, reconnecting...")
+            self._server.close()
+            self._server = None
+
+        logger.info("Connecting to SMTP server %s:%s...", self.smtp_server, self.smtp_port)
+
+        # Port 465 uses SSL, port 587 uses TLS
+        if self.smtp_port == 465:
+            # Use SMTP_SSL for port 465
+            server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port)
+            logger.info("Using SSL connection...")
+        else:
+            # Use SMTP with STARTTLS for port 587 or other ports
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+            logger.info("Using TLS connection...")
+
+        try:
+            if self.smtp_port != 465:
+                server.starttls()  # Enable encryption
+            logger.info("Logging in...")
+            server.login(self.sender_email, self.sender_password)
+        except Exception:
+            server.close()
+            raise
+
+        self._server = server
+        return server
+
+    async def aclose(self):
+        """
+        Closes the cached asynchronous SMTP connection, if one is open.
+        """
+        if self._async_server is None:
+            return
+
+        try:
+            await self._async_server.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            self._async_server.close()
+        finally:
+            self._async_server = None
+
+    async def _ensure_async_connection(self):
+        """
+        Returns a live asynchronous SMTP connection, opening it only when needed.
+
+        Async counterpart of _ensure_connection(): the session is cached and
+        health-checked with NOOP before reuse.
+
+        Returns:
+            aiosmtplib.SMTP: Connected and authenticated SMTP session
+        """
+        if self._async_server is not None:
+            if self._async_server.is_connected:
+                try:
+                    response = await self._async_server.noop(timeout=_NOOP_TIMEOUT)
+                    if response.code == 250:
+                        return self._async_server
+                except (aiosmtplib.SMTPException, OSError):
+                    pass
+
+            logger.info("Cached SMTP connection is no longer usable, reconnecting...")
+            self._async_server.close()
+            self._async_server = None
+
+        logger.info("Connecting to SMTP server %s:%s...", self.smtp_server, self.smtp_port)
+
+        # Port 465 uses SSL, port 587 uses TLS
+        smtp = aiosmtplib.SMTP(
+            hostname=self.smtp_server,
+            port=self.smtp_port,
+            use_tls=(self.smtp_port == 465),
+            start_tls=(self.smtp_port != 465)
+        )
+        await smtp.connect()
+
+        try:
+            logger.info("Logging in...")
+            await smtp.login(self.sender_email, self.sender_password)
+        except Exception:
+            smtp.close()
+            raise
+
+        self._async_server = smtp
+        return smtp
+
+    def _alive(self):
+        """
+        Checks the cached SMTP connection with a NOOP under a short timeout.
+
+        Servers drop idle sessions, so probing first avoids a failed send
+        round-trip on a stale socket.
+
+        Returns:
+            bool: True if the server answered the NOOP with 250
+        """
+        sock = self._server.sock
+        if sock is None:
+            return False
+
+        timeout = sock.gettimeout()
+        sock.settimeout(_NOOP_TIMEOUT)
+        try:
+            code, _ = self._server.noop()
+            return code == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+        finally:
+            # smtplib drops the socket when the server has disconnected
+            if self._server.sock is not None:
+                self._server.sock.settimeout(timeout)
 
     def send_notification(self, recipients, subject, message):
         """
-        Sends an email notification.
+        Sends an email notification to all recipients in one SMTP transaction.
+
+        Every recipient goes in the envelope only (BCC), so recipients don't
+        see each other's addresses. A refused recipient doesn't fail the whole
+        batch, and recipients over the server's per-message limit are retried
+        one at a time.
 
         Args:
             recipients: List of recipient email addresses
@@ -34,79 +270,219 @@ class EmailNotifier:
             message: Email body (plain text)
 
         Returns:
-            bool: True if successful, False otherwise
+            dict: Delivery summary with format:
+                  {
+                      'sent': [recipients that accepted the email],
+                      'failed': [(recipient, exception), ...]
+                  }
         """
+        summary = {'sent': [], 'failed': []}
+
         if not recipients:
-            print("No recipients specified, skipping email notification")
-            return False
+            logger.warning("No recipients specified, skipping email notification")
+            return summary
 
         if not self.sender_email or not self.sender_password:
-            print("Email credentials not configured, skipping email notification")
-            return False
+            logger.warning("Email credentials not configured, skipping email notification")
+            return summary
 
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['From'] = self.sender_email
-            msg['To'] = ', '.join(recipients)
-            msg['Subject'] = subject
+            msg = self._build_message(subject, message)
+            # Serialize once, every recipient gets the same bytes
+            raw = msg.as_bytes()
+
+            self._ensure_connection()
+            logger.info("Sending email to %d recipient(s)...", len(recipients))
+
+            refused = self._sendmail(raw, recipients)
+
+            # 452: the server caps recipients per message, retry those one at a time
+            for recipient in [r for r, (code, _) in refused.items() if code == 452]:
+                retry = self._sendmail(raw, [recipient])
+                if recipient in retry:
+                    refused[recipient] = retry[recipient]
+                else:
+                    del refused[recipient]
+
+            for recipient in recipients:
+                if recipient in refused:
+                    logger.error("ERROR: Recipient refused: %s", recipient)
+                    error = smtplib.SMTPRecipientsRefused({recipient: refused[recipient]})
+                    summary['failed'].append((recipient, error))
+                else:
+                    summary['sent'].append(recipient)
+
+            logger.info("Email sent successfully to %d recipient(s)!", len(summary['sent']))
+            return summary
 
-            # Add plain text body
-            text_part = MIMEText(message, 'plain', 'utf-8')
-            msg.attach(text_part)
+        except smtplib.SMTPAuthenticationError as e:
+            self._print_auth_error(e)
+            summary['failed'].extend((r, e) for r in recipients)
+            return summary
 
-            # Add HTML body for better formatting
-            html_message = self._format_html(message)
-            html_part = MIMEText(html_message, 'html', 'utf-8')
-            msg.attach(html_part)
-
-            # Connect and send
-            print(f"Connecting to SMTP server {self.smtp_server}:{self.smtp_port}...")
-
-            # Port 465 uses SSL, port 587 uses TLS
-            if self.smtp_port == 465:
-                # Use SMTP_SSL for port 465
-                with smtplib.SMTP_SSL(self.smtp_server, self.smtp_port) as server:
-                    print("Using SSL connection...")
-                    print("Logging in...")
-                    server.login(self.sender_email, self.sender_password)
-                    print(f"Sending email to {len(recipients)} recipient(s)...")
-                    server.send_message(msg)
-            else:
-                # Use SMTP with STARTTLS for port 587 or other ports
-                with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                    print("Using TLS connection...")
-                    server.starttls()  # Enable encryption
-                    print("Logging in...")
-                    server.login(self.sender_email, self.sender_password)
-                    print(f"Sending email to {len(recipients)} recipient(s)...")
-                    server.send_message(msg)
-
-            print("Email sent successfully!")
-            return True
+        except Exception as e:
+            logger.error("ERROR: Failed to send email: %s", e)
+            done = set(summary['sent']) | {r for r, _ in summary['failed']}
+            summary['failed'].extend((r, e) for r in recipients if r not in done)
+            return summary
 
-        except smtplib.SMTPAuthenticationError as e:
-            error_msg = str(e)
-            print("\n" + "=" * 70)
-            print("ERROR: Email Authentication Failed")
-            print("=" * 70)
-            print(f"Server: {error_msg}\n")
-
-            print("❌ Authentication failed - check your credentials")
-            print("\nQuick fix:")
-            print("  1. Go to: GitHub Settings → Secrets → Actions")
-            print("  2. Update SENDER_PASSWORD with correct password")
-            print("  3. For Gmail: Must use App Password (not regular password)")
-            print("  4. Re-run the workflow")
-            print(f"\nEmail: {self.sender_email}")
-            print(f"SMTP: {self.smtp_server}:{self.smtp_port}")
-            print("=" * 70 + "\n")
+    async def send_notification_async(self, recipients, subject, message):
+        """
+        Sends an email notification using an asynchronous SMTP client.
 
-            return False
+        Recipients are sent in one transaction over a cached connection on
+        the running event loop, like send_notification(). Use the notifier
+        as an async context manager to close the connection.
+
+        Args:
+            recipients: List of recipient email addresses
+            subject: Email subject
+            message: Email body (plain text)
+
+        Returns:
+            dict: Delivery summary, same format as send_notification()
+        """
+        summary = {'sent': [], 'failed': []}
+
+        if not recipients:
+            logger.warning("No recipients specified, skipping email notification")
+            return summary
+
+        if not self.sender_email or not self.sender_password:
+            logger.warning("Email credentials not configured, skipping email notification")
+            return summary
+
+        try:
+            msg = self._build_message(subject, message)
+            # Serialize once, every recipient gets the same bytes
+            raw = msg.as_bytes()
+
+            smtp = await self._ensure_async_connection()
+
+            logger.info("Sending email to %d recipient(s)...", len(recipients))
+            refused = await self._sendmail_async(smtp, raw, recipients)
+
+            # 452: the server caps recipients per message, retry those one at a time
+            for recipient in [r for r, (code, _) in refused.items() if code == 452]:
+                retry = await self._sendmail_async(smtp, raw, [recipient])
+                if recipient in retry:
+                    refused[recipient] = retry[recipient]
+                else:
+                    del refused[recipient]
+
+            for recipient in recipients:
+                if recipient in refused:
+                    code, reply = refused[recipient]
+                    logger.error("ERROR: Recipient refused: %s", recipient)
+                    error = aiosmtplib.SMTPRecipientRefused(code, reply, recipient)
+                    summary['failed'].append((recipient, error))
+                else:
+                    summary['sent'].append(recipient)
+
+            logger.info("Email sent successfully to %d recipient(s)!", len(summary['sent']))
+            return summary
+
+        except aiosmtplib.SMTPAuthenticationError as e:
+            self._print_auth_error(e)
+            summary['failed'].extend((r, e) for r in recipients)
+            return summary
 
         except Exception as e:
-            print(f"ERROR: Failed to send email: {e}")
-            return False
+            logger.error("ERROR: Failed to send email: %s", e)
+            summary['failed'].extend((r, e) for r in recipients)
+            return summary
+
+    def _build_message(self, subject, message):
+        """
+        Builds the email message.
+
+        Messages with notification formatting get an HTML alternative next to
+        the plain text. Plain messages (e.g. the test email) have nothing to
+        format, so they are sent as a single text/plain part.
+
+        Args:
+            subject: Email subject
+            message: Email body (plain text)
+
+        Returns:
+            EmailMessage: Message ready to be sent
+        """
+        msg = EmailMessage(policy=policy.SMTP)
+        msg['From'] = self.sender_email
+        msg['To'] = 'undisclosed-recipients:;'
+        msg['Subject'] = subject
+
+        # base64 keeps the Cyrillic body 7-bit safe for any relay
+        msg.set_content(message, cte='base64')
+
+        if any(marker in message for marker in _HTML_MARKERS):
+            # Add HTML body for better formatting
+            msg.add_alternative(self._format_html(message), subtype='html', cte='base64')
+
+        return msg
+
+    def _print_auth_error(self, error):
+        """
+        Prints troubleshooting help for a failed SMTP login.
+
+        Args:
+            error: Authentication exception raised by the SMTP client
+        """
+        logger.error("\n" + "=" * 70)
+        logger.error("ERROR: Email Authentication Failed")
+        logger.error("=" * 70)
+        logger.error("Server: %s\n", error)
+
+        logger.error("❌ Authentication failed - check your credentials")
+        logger.error("\nQuick fix:")
+        logger.error("  1. Go to: GitHub Settings → Secrets → Actions")
+        logger.error("  2. Update SENDER_PASSWORD with correct password")
+        logger.error("  3. For Gmail: Must use App Password (not regular password)")
+        logger.error("  4. Re-run the workflow")
+        logger.error("\nEmail: %s", self.sender_email)
+        logger.error("SMTP: %s:%s", self.smtp_server, self.smtp_port)
+        logger.error("=" * 70 + "\n")
+
+    def _sendmail(self, raw, recipients):
+        """
+        Sends a serialized message in one transaction over the cached session.
+
+        Args:
+            raw: Message serialized to bytes
+            recipients: List of recipient email addresses
+
+        Returns:
+            dict: Refused recipients mapped to the server's (code, reply)
+        """
+        try:
+            try:
+                return self._server.sendmail(self.sender_email, recipients, raw)
+            except smtplib.SMTPServerDisconnected:
+                # Cached session was dropped by the server, reconnect once
+                logger.warning("SMTP connection lost, reconnecting...")
+                self._server = None
+                return self._ensure_connection().sendmail(self.sender_email, recipients, raw)
+        except smtplib.SMTPRecipientsRefused as e:
+            return e.recipients
+
+    async def _sendmail_async(self, smtp, raw, recipients):
+        """
+        Sends a serialized message in one transaction over an async connection.
+
+        Args:
+            smtp: Connected aiosmtplib client
+            raw: Message serialized to bytes
+            recipients: List of recipient email addresses
+
+        Returns:
+            dict: Refused recipients mapped to the server's (code, reply)
+        """
+        try:
+            errors, _ = await smtp.sendmail(self.sender_email, recipients, raw)
+        except aiosmtplib.SMTPRecipientsRefused as e:
+            return {error.recipient: (error.code, error.message) for error in e.recipients}
+        return {recipient: (response.code, response.message)
+                for recipient, response in errors.items()}
 
     def _format_html(self, plain_text):
         """
@@ -118,34 +494,7 @@ class EmailNotifier:
         Returns:
             str: HTML formatted message
         """
-        lines = plain_text.split('\n')
-        html_lines = ['<html><body style="font-family: Arial, sans-serif;">']
-
-        for line in lines:
-            if '===' in line:
-                # Horizontal rule
-                html_lines.append('<hr/>')
-            elif line.startswith('Date:'):
-                # Date header
-                html_lines.append(f'<h2 style="color: #d32f2f;">{line}</h2>')
-            elif line.startswith('Location:'):
-                # Location
-                html_lines.append(f'<p style="margin: 5px 0;"><strong>{line}</strong></p>')
-            elif line.startswith('  ') or line.startswith('Region:') or line.startswith('Municipality:') or line.startswith('Time:'):
-                # Indented details
-                html_lines.append(f'<p style="margin: 2px 0 2px 20px; color: #555;">{line}</p>')
-            elif line.strip().startswith('PLANNED') or line.strip().startswith('SUMMARY'):
-                # Title
-                html_lines.append(f'<h1 style="color: #1976d2;">{line}</h1>')
-            elif line.strip():
-                # Regular text
-                html_lines.append(f'<p style="margin: 5px 0;">{line}</p>')
-            else:
-                # Empty line
-                html_lines.append('<br/>')
-
-        html_lines.append('</body></html>')
-        return ''.join(html_lines)
+        return _plain_to_html(plain_text)
 
 
 def test_email_config(smtp_server, smtp_port, sender_email, sender_password, test_recipient):
@@ -162,23 +511,26 @@ def test_email_config(smtp_server, smtp_port, sender_email, sender_password, tes
     Returns:
         bool: True if test successful
     """
-    notifier = EmailNotifier(smtp_server, smtp_port, sender_email, sender_password)
-
     subject = "Test Email - Electricity Cut Notifier"
+    sent_at = time.strftime('%Y-%m-%d %H:%M:%S')
     message = f"""This is a test email from the Electricity Cut Notifier.
 
 If you received this, your email configuration is working correctly!
 
-Sent at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Sent at: {sent_at}
 """
 
-    return notifier.send_notification([test_recipient], subject, message)
+    with EmailNotifier(smtp_server, smtp_port, sender_email, sender_password) as notifier:
+        summary = notifier.send_notification([test_recipient], subject, message)
+    return bool(summary['sent'])
 
 
 def main():
     """
     Interactive email configuration and testing.
     """
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     print("=" * 70)
     print("Email Notifier Configuration Test")
     print("=" * 70)
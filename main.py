@@ -10,158 +10,292 @@ This script:
 """
 
 import os
+import re
+import sys
 import json
+import asyncio
+import logging
+import hashlib
+import functools
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from scraper import ElectricityCutScraper
-from pdf_parser import PDFCutParser
+from pdf_parser import Cut, PDFCutParser
 from email_notifier import EmailNotifier
 import traceback
-import re
 
+try:
+    import ahocorasick
+except ImportError:
+    # Cities are matched with a single compiled regex instead
+    ahocorasick = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class CutNotifier:
+
+logger = logging.getLogger(__name__)
+
+
+def _json_loads(data):
     """
-    Main application class for monitoring and notifying about electricity cuts.
+    Parses JSON, using orjson when it is installed.
+
+    Args:
+        data: JSON document as bytes
+
+    Returns:
+        Parsed JSON value
     """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
-    def __init__(self, config_file='config.json'):
-        """
-        Initialize the notifier with configuration.
 
-        Args:
-            config_file: Path to JSON configuration file
-        """
-        self.config_file = config_file
-        self.config = self.load_config()
-        self.validate_config()
-        self.scraper = ElectricityCutScraper()
+def _json_dumps(value, indent=False):
+    """
+    Serializes a value to UTF-8 JSON, using orjson when it is installed.
 
-    def load_config(self):
-        """
-        Loads configuration from JSON file and environment variables.
+    Args:
+        value: JSON-serializable value
+        indent: Pretty-print with two-space indentation
 
-        Environment variables (for GitHub Actions):
-        - SENDER_EMAIL: Email address to send from
-        - SENDER_PASSWORD: Email password
-        - EMAIL_RECIPIENTS: Comma-separated list of recipients
+    Returns:
+        bytes: UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(value, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
 
-        Config format:
-        {
-            "monitored_cities": ["СОФИЯ", "ПЕРНИК", "БЛАГОЕВГРАД"],
-            "pdf_cache_dir": "./pdfs",
-            "check_days_ahead": 3
-        }
 
-        Returns:
-            dict: Configuration dictionary
-        """
-        if not os.path.exists(self.config_file):
-            raise FileNotFoundError(
-                f"❌ Configuration file '{self.config_file}' not found!\n"
-                f"   Create it from the example: cp config.example.json config.json\n"
-                f"   See README.md for configuration instructions."
-            )
+@functools.lru_cache(maxsize=1)
+def _load_raw_config(config_file):
+    """
+    Reads and parses the JSON configuration file once per process.
 
-        try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-        except json.JSONDecodeError as e:
-            raise ValueError(
-                f"❌ Invalid JSON in '{self.config_file}':\n"
-                f"   {str(e)}\n"
-                f"   Check for syntax errors (missing commas, quotes, etc.)"
-            )
+    Callers must copy the returned dict before modifying it.
 
-        # Override with environment variables (for GitHub Actions)
-        config['sender_email'] = os.getenv('SENDER_EMAIL').strip()
-        config['sender_password'] = os.getenv('SENDER_PASSWORD').strip()
+    Args:
+        config_file: Path to JSON configuration file
 
-        # Parse comma-separated recipients from env var
-        recipients_env = os.getenv('EMAIL_RECIPIENTS').strip()
-        if recipients_env:
-            config['email_recipients'] = [email.strip() for email in recipients_env.split(',') if email.strip()]
-        elif 'email_recipients' not in config:
-            config['email_recipients'] = []
+    Returns:
+        dict: Parsed configuration file contents
+    """
+    if not Path(config_file).is_file():
+        raise FileNotFoundError(
+            f"❌ Configuration file '{config_file}' not found!\n"
+            f"   Create it from the example: cp config.example.json config.json\n"
+            f"   See README.md for configuration instructions."
+        )
+
+    try:
+        with open(config_file, 'rb') as f:
+            return _json_loads(f.read())
+    except json.JSONDecodeError as e:
+        raise ValueError(
+            f"❌ Invalid JSON in '{config_file}':\n"
+            f"   {str(e)}\n"
+            f"   Check for syntax errors (missing commas, quotes, etc.)"
+        )
 
-        return config
 
-    def validate_config(self):
+def _cities_key(cities):
+    """
+    Normalizes city names for comparing the cities a parse cache was built for.
+
+    Args:
+        cities: List of city names
+
+    Returns:
+        list: Sorted, deduplicated, uppercased city names
+    """
+    return sorted({city.upper() for city in cities})
+
+
+def _is_whole_word(text, end_index, word):
+    """
+    Checks that a substring match is not part of a longer word.
+
+    Args:
+        text: Text that was searched
+        end_index: Index of the last character of the match
+        word: Matched word
+
+    Returns:
+        bool: True if the match is bounded by non-word characters
+    """
+    start = end_index - len(word) + 1
+    end = end_index + 1
+
+    if start > 0 and (text[start - 1].isalnum() or text[start - 1] == '_'):
+        return False
+    if end < len(text) and (text[end].isalnum() or text[end] == '_'):
+        return False
+    return True
+
+
+@dataclass(frozen=True)
+class CutConfig:
+    """
+    Validated configuration snapshot, built once per run by CutNotifier.load_config().
+
+    Defaults apply to settings missing from config.json. Lists are stored as
+    tuples so the snapshot can't be modified after validation.
+    """
+    monitored_cities: tuple = ()
+    pdf_cache_dir: str = './pdfs'
+    check_days_ahead: int = 3
+    smtp_server: str = 'smtp.gmail.com'
+    smtp_port: int = 587
+    sender_email: str = ''
+    sender_password: str = field(default='', repr=False)
+    email_recipients: tuple = ()
+
+    def __post_init__(self):
         """
-        Validates configuration and fails fast if something is wrong.
+        Validates the configuration and fails fast if something is wrong.
 
         This ensures errors are caught early in the GitHub Actions pipeline.
         """
         errors = []
 
         # Check required fields in config.json
-        if not self.config.get('monitored_cities'):
+        if not self.monitored_cities:
             errors.append("❌ 'monitored_cities' is missing or empty in config.json")
-        elif not isinstance(self.config['monitored_cities'], list):
+        elif not isinstance(self.monitored_cities, (list, tuple)):
             errors.append("❌ 'monitored_cities' must be a list")
-        elif len(self.config['monitored_cities']) == 0:
-            errors.append("❌ 'monitored_cities' list is empty - add at least one city")
 
-        if not self.config.get('smtp_server'):
+        if not self.smtp_server:
             errors.append("❌ 'smtp_server' is missing in config.json")
 
-        if not self.config.get('smtp_port'):
+        if not self.smtp_port:
             errors.append("❌ 'smtp_port' is missing in config.json")
-        elif not isinstance(self.config['smtp_port'], int):
-            errors.append(f"❌ 'smtp_port' must be a number, got: {type(self.config['smtp_port']).__name__}")
+        elif not isinstance(self.smtp_port, int):
+            errors.append(f"❌ 'smtp_port' must be a number, got: {type(self.smtp_port).__name__}")
 
         # Check environment variables (GitHub Secrets)
-        if not self.config.get('sender_email'):
+        if not self.sender_email:
             errors.append("❌ SENDER_EMAIL environment variable is not set (check GitHub Secrets)")
 
-        if not self.config.get('sender_password'):
+        if not self.sender_password:
             errors.append("❌ SENDER_PASSWORD environment variable is not set (check GitHub Secrets)")
 
-        if not self.config.get('email_recipients'):
+        if not self.email_recipients:
             errors.append("❌ EMAIL_RECIPIENTS environment variable is not set (check GitHub Secrets)")
-        elif not isinstance(self.config['email_recipients'], list):
+        elif not isinstance(self.email_recipients, (list, tuple)):
             errors.append("❌ EMAIL_RECIPIENTS must be a comma-separated list")
-        elif len(self.config['email_recipients']) == 0:
-            errors.append("❌ EMAIL_RECIPIENTS is empty - add at least one recipient")
-
-        # Validate email format (basic check)
-        sender = self.config.get('sender_email', '')
-        if sender and '@' not in sender:
-            errors.append(f"❌ SENDER_EMAIL appears invalid: '{sender}'")
+        else:
+            # Validate email format (basic check)
+            for recipient in self.email_recipients:
+                if '@' not in recipient:
+                    errors.append(f"❌ EMAIL_RECIPIENTS contains invalid email: '{recipient}'")
 
-        for recipient in self.config.get('email_recipients', []):
-            if '@' not in recipient:
-                errors.append(f"❌ EMAIL_RECIPIENTS contains invalid email: '{recipient}'")
+        if self.sender_email and '@' not in self.sender_email:
+            errors.append(f"❌ SENDER_EMAIL appears invalid: '{self.sender_email}'")
 
         # If there are errors, print them and fail
         if errors:
-            print("\n" + "=" * 70)
-            print("КОНФИГУРАЦИОННА ГРЕШКА / CONFIGURATION ERROR")
-            print("=" * 70)
-            print("\nПроблеми с конфигурацията / Configuration issues:\n")
+            logger.error("\n" + "=" * 70)
+            logger.error("КОНФИГУРАЦИОННА ГРЕШКА / CONFIGURATION ERROR")
+            logger.error("=" * 70)
+            logger.error("\nПроблеми с конфигурацията / Configuration issues:\n")
             for error in errors:
-                print(f"  {error}")
-
-            print("\n" + "-" * 70)
-            print("Как да поправите / How to fix:")
-            print("-" * 70)
-            print("1. Проверете config.json за градове и SMTP настройки")
-            print("   Check config.json for cities and SMTP settings")
-            print("\n2. Проверете GitHub Secrets (Settings → Secrets → Actions):")
-            print("   Check GitHub Secrets (Settings → Secrets → Actions):")
-            print("   - SENDER_EMAIL")
-            print("   - SENDER_PASSWORD")
-            print("   - EMAIL_RECIPIENTS")
-            print("\n3. Вижте README.md за детайли")
-            print("   See README.md for details")
-            print("=" * 70 + "\n")
+                logger.error("  %s", error)
+
+            logger.error("\n" + "-" * 70)
+            logger.error("Как да поправите / How to fix:")
+            logger.error("-" * 70)
+            logger.error("1. Проверете config.json за градове и SMTP настройки")
+            logger.error("   Check config.json for cities and SMTP settings")
+            logger.error("\n2. Проверете GitHub Secrets (Settings → Secrets → Actions):")
+            logger.error("   Check GitHub Secrets (Settings → Secrets → Actions):")
+            logger.error("   - SENDER_EMAIL")
+            logger.error("   - SENDER_PASSWORD")
+            logger.error("   - EMAIL_RECIPIENTS")
+            logger.error("\n3. Вижте README.md за детайли")
+            logger.error("   See README.md for details")
+            logger.error("=" * 70 + "\n")
 
             raise ValueError(f"Configuration validation failed with {len(errors)} error(s)")
 
-        # Success message
-        print("✅ Configuration validated")
-        print(f"   Cities: {', '.join(self.config['monitored_cities'])}")
-        print(f"   Recipients: {len(self.config['email_recipients'])}")
-        print(f"   SMTP: {self.config['smtp_server']}:{self.config['smtp_port']}\n")
+        # Frozen: store the lists as tuples through object.__setattr__
+        object.__setattr__(self, 'monitored_cities', tuple(self.monitored_cities))
+        object.__setattr__(self, 'email_recipients', tuple(self.email_recipients))
+
+
+class CutNotifier:
+    """
+    Main application class for monitoring and notifying about electricity cuts.
+    """
+
+    def __init__(self, config_file='config.json'):
+        """
+        Initialize the notifier with configuration.
+
+        Args:
+            config_file: Path to JSON configuration file
+        """
+        self.config_file = config_file
+        self.config = self.load_config()
+
+        logger.info("✅ Configuration validated")
+        logger.info("   Cities: %s", ', '.join(self.config.monitored_cities))
+        logger.info("   Recipients: %d", len(self.config.email_recipients))
+        logger.info("   SMTP: %s:%s\n", self.config.smtp_server, self.config.smtp_port)
+
+        self.scraper = ElectricityCutScraper(
+            state_file=os.path.join(self.config.pdf_cache_dir, 'scraper_state.json')
+        )
+        # Monitored cities don't change during a run, compile them once
+        self.city_matcher = self.build_city_matcher(self.config.monitored_cities)
+
+    def close(self):
+        """
+        Closes the scraper's HTTP connections.
+        """
+        self.scraper.close()
+
+    def load_config(self):
+        """
+        Loads configuration from JSON file and environment variables.
+
+        Environment variables (for GitHub Actions):
+        - SENDER_EMAIL: Email address to send from
+        - SENDER_PASSWORD: Email password
+        - EMAIL_RECIPIENTS: Comma-separated list of recipients
+
+        Config format:
+        {
+            "monitored_cities": ["СОФИЯ", "ПЕРНИК", "БЛАГОЕВГРАД"],
+            "pdf_cache_dir": "./pdfs",
+            "check_days_ahead": 3
+        }
+
+        Settings missing from the file fall back to the CutConfig defaults.
+
+        Returns:
+            CutConfig: Validated configuration
+
+        Raises:
+            ValueError: If the configuration is invalid
+        """
+        # Copy so the cached file contents are never modified
+        config = dict(_load_raw_config(self.config_file))
+
+        # Override with environment variables (for GitHub Actions)
+        config['sender_email'] = os.getenv('SENDER_EMAIL', '').strip()
+        config['sender_password'] = os.getenv('SENDER_PASSWORD', '').strip()
+
+        # Parse comma-separated recipients from env var
+        recipients_env = os.getenv('EMAIL_RECIPIENTS', '').strip()
+        if recipients_env:
+            config['email_recipients'] = [email.strip() for email in recipients_env.split(',') if email.strip()]
+
+        # Unknown keys in config.json are ignored
+        return CutConfig(**{f.name: config[f.name] for f in fields(CutConfig) if f.name in config})
 
     def save_config(self, config=None):
         """
@@ -171,19 +305,23 @@ class CutNotifier:
             config: Configuration dict to save (uses self.config if None)
         """
         if config is None:
-            config = self.config
+            config = asdict(self.config)
 
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        with open(self.config_file, 'wb') as f:
+            f.write(_json_dumps(config, indent=True))
 
     def ensure_cache_dir(self):
         """
         Creates the PDF cache directory if it doesn't exist.
         """
-        cache_dir = self.config['pdf_cache_dir']
-        if not os.path.exists(cache_dir):
-            os.makedirs(cache_dir)
-            print(f"Created cache directory: {cache_dir}")
+        cache_dir = self.config.pdf_cache_dir
+        # A single mkdir call; it fails if the directory is already there,
+        # including when a download worker created it concurrently
+        try:
+            Path(cache_dir).mkdir(parents=True)
+        except FileExistsError:
+            return
+        logger.info("Created cache directory: %s", cache_dir)
 
     def fetch_latest_cuts(self):
         """
@@ -192,8 +330,10 @@ class CutNotifier:
         Returns:
             list: List of document metadata
         """
-        days = self.config.get('check_days_ahead', 3)
-        print(f"\nFetching planned cuts for next {days} days...")
+        days = self.config.check_days_ahead
+        logger.info("\nFetching planned cuts for next %s days...", days)
+        # The scraper keeps its listing state in the cache directory
+        self.ensure_cache_dir()
         return self.scraper.get_latest_cuts(days=days)
 
     def download_and_parse_pdf(self, doc):
@@ -204,39 +344,191 @@ class CutNotifier:
             doc: Document metadata dict with 'doc_id' and 'date'
 
         Returns:
-            tuple: (pdf_path, list of cut entries)
+            tuple: (pdf_path, list of Cut entries)
         """
         self.ensure_cache_dir()
 
         # Generate filename
         date_clean = doc['date'].replace('.', '-')
         pdf_path = os.path.join(
-            self.config['pdf_cache_dir'],
+            self.config.pdf_cache_dir,
             f"cuts_{date_clean}.pdf"
         )
 
         # Download if not cached
         if not os.path.exists(pdf_path):
-            print(f"Downloading PDF for {doc['date']}...")
+            logger.info("Downloading PDF for %s...", doc['date'])
             success = self.scraper.download_pdf(doc['doc_id'], pdf_path)
             if not success:
                 return None, []
         else:
-            print(f"Using cached PDF for {doc['date']}")
-
-        # Parse the PDF
-        parser = PDFCutParser(pdf_path)
-        cuts = parser.extract_cut_details()
+            logger.info("Using cached PDF for %s", doc['date'])
+
+        # Reuse parsed results if the PDF hasn't changed since last parse.
+        # A sidecar written after the PDF is trusted without hashing; an
+        # older one is only reused if the PDF content is still the same.
+        pdf_hash = None
+        if not self.parse_cache_is_fresh(pdf_path):
+            pdf_hash = self.hash_file(pdf_path)
+        monitored_cities = self.config.monitored_cities
+        cuts = self.load_parsed_cuts(pdf_path, pdf_hash, monitored_cities)
+        if cuts is not None:
+            logger.info("Using cached parse results for %s", doc['date'])
+        else:
+            # Parse the PDF, skipping entries that can't name a monitored city
+            parser = PDFCutParser(pdf_path)
+            cuts = parser.extract_cut_details(city_filter=monitored_cities)
+            # A failed extraction also yields no cuts, but must not be cached
+            # or the next runs would trust it without parsing again
+            if parser.cut_text is not None:
+                if pdf_hash is None:
+                    pdf_hash = self.hash_file(pdf_path)
+                self.save_parsed_cuts(pdf_path, pdf_hash, cuts, monitored_cities)
 
         return pdf_path, cuts
 
-    def filter_cuts_by_city(self, cuts, cities):
+    def hash_file(self, path):
+        """
+        Computes the SHA-256 digest of a file.
+
+        Args:
+            path: Path to the file
+
+        Returns:
+            str: Hex digest of the file contents
+        """
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(64 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def parse_cache_is_fresh(self, pdf_path):
+        """
+        Checks whether the JSON sidecar of a PDF was written after the PDF.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            bool: True if the sidecar exists and is not older than the PDF
+        """
+        try:
+            return os.stat(pdf_path + '.json').st_mtime >= os.stat(pdf_path).st_mtime
+        except OSError:
+            return False
+
+    def load_parsed_cuts(self, pdf_path, pdf_hash=None, cities=()):
+        """
+        Loads parsed cuts from the JSON sidecar next to a PDF.
+
+        Args:
+            pdf_path: Path to the PDF file
+            pdf_hash: SHA-256 digest of the PDF the cuts must belong to
+                      (None to skip the check, e.g. for a fresh sidecar)
+            cities: City filter the cuts must have been parsed with
+
+        Returns:
+            list: Cached Cut entries, or None if missing or stale
+        """
+        sidecar_path = pdf_path + '.json'
+        try:
+            with open(sidecar_path, 'rb') as f:
+                data = _json_loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable parse cache %s: %s", sidecar_path, e)
+            return None
+
+        # Valid JSON can still be a corrupt or foreign file
+        if not isinstance(data, dict):
+            logger.warning("Ignoring unreadable parse cache %s: unexpected format", sidecar_path)
+            return None
+
+        if data.get('cities', []) != _cities_key(cities):
+            return None
+
+        if pdf_hash is not None:
+            if data.get('sha256') != pdf_hash:
+                return None
+            # Same content, mark the sidecar fresh so the next run skips hashing
+            try:
+                os.utime(sidecar_path)
+            except OSError:
+                pass
+
+        try:
+            return [Cut(**entry) for entry in data['cuts']]
+        except (KeyError, TypeError):
+            # Written by a version with different cut fields
+            return None
+
+    def save_parsed_cuts(self, pdf_path, pdf_hash, cuts, cities=()):
+        """
+        Saves parsed cuts to a JSON sidecar next to the PDF.
+
+        Args:
+            pdf_path: Path to the PDF file
+            pdf_hash: SHA-256 digest of the parsed PDF
+            cuts: List of Cut entries parsed from the PDF
+            cities: City filter the PDF was parsed with
+        """
+        sidecar_path = pdf_path + '.json'
+        data = {
+            'sha256': pdf_hash,
+            'cities': _cities_key(cities),
+            'cuts': [cut._asdict() for cut in cuts]
+        }
+        try:
+            with open(sidecar_path, 'wb') as f:
+                f.write(_json_dumps(data))
+        except OSError as e:
+            logger.warning("Could not write parse cache %s: %s", sidecar_path, e)
+
+    def build_city_matcher(self, cities):
+        """
+        Builds a predicate matching uppercased locations against the city names.
+
+        Uses an Aho-Corasick automaton when pyahocorasick is installed and a
+        single compiled regex alternation otherwise. Either way each location
+        is scanned once, however many cities there are.
+
+        Args:
+            cities: List of city names to match
+
+        Returns:
+            callable: Takes an uppercased location, returns True if it names one of the cities
+        """
+        # Deduplicated, order kept
+        cities_upper = list(dict.fromkeys(city.upper() for city in cities))
+
+        if ahocorasick is None:
+            # Lookarounds give the same word boundaries as _is_whole_word()
+            pattern = re.compile(
+                r'(?<!\w)(?:' + '|'.join(map(re.escape, cities_upper)) + r')(?!\w)'
+            )
+            return lambda location: pattern.search(location) is not None
+
+        automaton = ahocorasick.Automaton()
+        for city_upper in cities_upper:
+            automaton.add_word(city_upper, city_upper)
+        automaton.make_automaton()
+
+        def matches(location):
+            return any(_is_whole_word(location, end_index, city)
+                       for end_index, city in automaton.iter(location))
+
+        return matches
+
+    def filter_cuts_by_city(self, cuts, cities, matcher=None):
         """
         Filters electricity cuts to only include specified cities.
 
         Args:
-            cuts: List of cut entry dicts
+            cuts: List of Cut entries from download_and_parse_pdf()
             cities: List of city names to match (word boundary match, case-insensitive)
+            matcher: Prebuilt matcher from build_city_matcher() (built from cities if None)
 
         Returns:
             list: Filtered cuts that match the specified cities
@@ -244,22 +536,11 @@ class CutNotifier:
         if not cities:
             return cuts
 
-        filtered = []
-        cities_upper = [city.upper() for city in cities]
-
-        for cut in cuts:
-            location = cut['location'].upper()
-
-            # Use word boundary matching to avoid "ДЕБРЕН" matching "ДЕБРЕНЕ"
-            # \b ensures we match complete words only
-            for city in cities_upper:
-                # Create pattern with word boundaries
-                pattern = r'\b' + re.escape(city) + r'\b'
-                if re.search(pattern, location):
-                    filtered.append(cut)
-                    break
+        if matcher is None:
+            matcher = self.build_city_matcher(cities)
 
-        return filtered
+        # Word boundaries are checked to avoid "ДЕБРЕН" matching "ДЕБРЕНЕ"
+        return [cut for cut in cuts if matcher(cut.location_upper)]
 
     def check_for_cuts(self):
         """
@@ -272,46 +553,67 @@ class CutNotifier:
                       ...
                   }
         """
-        print("=" * 70)
-        print("Electricity Cut Notifier")
-        print("=" * 70)
+        logger.info("=" * 70)
+        logger.info("Electricity Cut Notifier")
+        logger.info("=" * 70)
 
-        monitored_cities = self.config['monitored_cities']
-        print(f"Monitoring cities: {', '.join(monitored_cities)}")
+        monitored_cities = self.config.monitored_cities
+        logger.info("Monitoring cities: %s", ', '.join(monitored_cities))
 
         # Fetch latest documents
         documents = self.fetch_latest_cuts()
-        print(f"Found {len(documents)} documents to check\n")
+        logger.info("Found %d documents to check\n", len(documents))
 
         results = {}
+        if not documents:
+            return results
+
+        # Download and parse all documents concurrently, the work is mostly
+        # waiting on the network. Filtering and reporting stay on this thread.
+        with ThreadPoolExecutor(max_workers=min(8, len(documents))) as executor:
+            futures = {
+                executor.submit(self.download_and_parse_pdf, doc): doc
+                for doc in documents
+            }
+
+            for future in as_completed(futures):
+                doc = futures[future]
+                pdf_path, cuts = future.result()
+                self.report_document_cuts(doc, cuts, monitored_cities, results)
 
-        # Process each document
-        for doc in documents:
-            print(f"\nProcessing: {doc['title']}")
-            print("-" * 70)
+        return results
 
-            pdf_path, cuts = self.download_and_parse_pdf(doc)
+    def report_document_cuts(self, doc, cuts, monitored_cities, results):
+        """
+        Filters the cuts of one document and records the ones that matter.
 
-            if not cuts:
-                print(f"  No cuts found in document")
-                continue
+        Args:
+            doc: Document metadata dict with 'title' and 'date'
+            cuts: List of cut entries parsed from the document
+            monitored_cities: List of city names to match
+            results: Results dict to add matching cuts to, keyed by date
+        """
+        logger.info("\nProcessing: %s", doc['title'])
+        logger.info("-" * 70)
 
-            print(f"  Total cuts in document: {len(cuts)}")
+        if not cuts:
+            logger.info("  No cuts found in document")
+            return
 
-            # Filter by monitored cities
-            filtered_cuts = self.filter_cuts_by_city(cuts, monitored_cities)
+        logger.info("  Candidate cuts in document: %d", len(cuts))
 
-            if filtered_cuts:
-                results[doc['date']] = filtered_cuts
-                print(f"  ALERT: {len(filtered_cuts)} cut(s) affect your monitored cities!")
+        # Filter by monitored cities
+        filtered_cuts = self.filter_cuts_by_city(cuts, monitored_cities, self.city_matcher)
 
-                for cut in filtered_cuts:
-                    print(f"    - {cut['location']}: "
-                          f"{cut['time_start']} - {cut['time_end']}")
-            else:
-                print(f"  No cuts affect your monitored cities")
+        if filtered_cuts:
+            results[doc['date']] = filtered_cuts
+            logger.info("  ALERT: %d cut(s) affect your monitored cities!", len(filtered_cuts))
 
-        return results
+            for cut in filtered_cuts:
+                logger.info("    - %s: %s - %s",
+                            cut.location, cut.time_start, cut.time_end)
+        else:
+            logger.info("  No cuts affect your monitored cities")
 
     def format_notification_message(self, results):
         """
@@ -328,15 +630,16 @@ class CutNotifier:
 
         lines = ["ПЛАНИРАНИ ПРЕКЪСВАНИЯ НА ТОКА - ИЗВЕСТИЕ", "=" * 70, ""]
 
-        for date, cuts in sorted(results.items()):
+        # Dates are DD.MM.YYYY, compare them as (YYYY, MM, DD) for chronological order
+        for date, cuts in sorted(results.items(), key=lambda item: item[0].split('.')[::-1]):
             lines.append(f"Дата: {date}")
             lines.append("-" * 70)
 
             for cut in cuts:
-                lines.append(f"Населено място: {cut['location']}")
-                lines.append(f"Област: {cut['region']}")
-                lines.append(f"Община: {cut['municipality']}")
-                lines.append(f"Време: {cut['time_start']} - {cut['time_end']}")
+                lines.append(f"Населено място: {cut.location}")
+                lines.append(f"Област: {cut.region}")
+                lines.append(f"Община: {cut.municipality}")
+                lines.append(f"Време: {cut.time_start} - {cut.time_end}")
                 lines.append("")
 
         lines.append("=" * 70)
@@ -345,68 +648,88 @@ class CutNotifier:
         return "\n".join(lines)
 
 
-def main():
+async def main_async():
     """
     Main entry point with error handling.
     """
     try:
         notifier = CutNotifier()
 
-        # Check for cuts
-        results = notifier.check_for_cuts()
+        # Check for cuts; nothing is downloaded after this
+        try:
+            results = notifier.check_for_cuts()
+        finally:
+            notifier.close()
 
         # Display results
-        print("\n" + "=" * 70)
-        print("РЕЗЮМЕ")
-        print("=" * 70)
+        logger.info("\n" + "=" * 70)
+        logger.info("РЕЗЮМЕ")
+        logger.info("=" * 70)
+
+        # Nothing to report, skip formatting and SMTP entirely
+        if not results:
+            logger.info("\nНе са намерени прекъсвания - не е необходимо известие.")
+            return
 
         message = notifier.format_notification_message(results)
-        print(message)
+        logger.info("%s", message)
+
+        recipients = notifier.config.email_recipients
+        if not recipients:
+            logger.info("\nНяма конфигурирани получатели на имейл. Добавете ги в config.json за да получавате известия.")
+            return
 
         # Send email notifications
-        if results and notifier.config.get('email_recipients'):
-            recipients = notifier.config['email_recipients']
-            print(f"\nИзпращане на имейл известие до {len(recipients)} получател(и)...")
-
-            email_notifier = EmailNotifier(
-                smtp_server=notifier.config.get('smtp_server', 'smtp.gmail.com'),
-                smtp_port=notifier.config.get('smtp_port', 587),
-                sender_email=notifier.config.get('sender_email', ''),
-                sender_password=notifier.config.get('sender_password', '')
+        logger.info("\nИзпращане на имейл известие до %d получател(и)...", len(recipients))
+
+        subject = f"Известие за прекъсване на тока - {len(results)} дат(и) засегнат(и)"
+
+        async with EmailNotifier(
+            smtp_server=notifier.config.smtp_server,
+            smtp_port=notifier.config.smtp_port,
+            sender_email=notifier.config.sender_email,
+            sender_password=notifier.config.sender_password
+        ) as email_notifier:
+            summary = await email_notifier.send_notification_async(recipients, subject, message)
+
+        for recipient, error in summary['failed']:
+            logger.error("  Неуспешно изпращане до %s: %s", recipient, error)
+
+        if not summary['sent']:
+            raise RuntimeError(
+                "Failed to send email notification. "
+                "Check the error messages above for details. "
+                "Common issue: Wrong password in SENDER_PASSWORD secret."
             )
 
-            subject = f"Известие за прекъсване на тока - {len(results)} дат(и) засегнат(и)"
-            success = email_notifier.send_notification(recipients, subject, message)
-
-            if not success:
-                raise RuntimeError(
-                    "Failed to send email notification. "
-                    "Check the error messages above for details. "
-                    "Common issue: Wrong password in SENDER_PASSWORD secret."
-                )
-        elif results:
-            print("\nНяма конфигурирани получатели на имейл. Добавете ги в config.json за да получавате известия.")
-        else:
-            print("\nНе са намерени прекъсвания - не е необходимо известие.")
-
     except Exception as e:
         error_msg = str(e)
         error_trace = traceback.format_exc()
 
-        print("\n" + "=" * 70)
-        print("ГРЕШКА / ERROR")
-        print("=" * 70)
-        print(f"Възникна грешка: {error_msg}")
-        print("\nПълни детайли:")
-        print(error_trace)
-        print("\n" + "=" * 70)
+        logger.error("\n" + "=" * 70)
+        logger.error("ГРЕШКА / ERROR")
+        logger.error("=" * 70)
+        logger.error("Възникна грешка: %s", error_msg)
+        logger.error("\nПълни детайли:")
+        logger.error("%s", error_trace)
+        logger.error("\n" + "=" * 70)
 
-        print("GitHub Actions will notify you about this failure.")
-        print("=" * 70)
+        logger.error("GitHub Actions will notify you about this failure.")
+        logger.error("=" * 70)
 
         # Re-raise to ensure GitHub Actions marks the run as failed
         raise
 
 
+def main():
+    """
+    Synchronous entry point that runs the notifier on an event loop.
+    """
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    # httpx logs every request at INFO
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    asyncio.run(main_async())
+
+
 if __name__ == "__main__":
     main()
@@ -1,6 +1,131 @@
-import PyPDF2
+import functools
+import os
 import re
+import logging
+import multiprocessing
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from typing import NamedTuple, Optional
+
+try:
+    import pymupdf
+except ImportError:
+    # Slower pure-Python fallback
+    pymupdf = None
+    import PyPDF2
+
+
+logger = logging.getLogger(__name__)
+
+# PyMuPDF is not thread-safe: documents are extracted one at a time per process
+_PYMUPDF_LOCK = threading.Lock()
+
+# Marks PDFCutParser text that hasn't been extracted yet (None means it failed)
+_NOT_EXTRACTED = object()
+
+# Below this many pages, starting worker processes costs more than it saves.
+# Serial extraction takes about 1-2 ms per page, while spawning a pool of
+# 4 workers (each re-importing the main module) takes about 0.8 s, so
+# 4 workers only break even somewhere around 500-900 pages.
+_PARALLEL_MIN_PAGES = 500
+
+
+# One pattern for everything of interest, so the text is scanned once:
+# - "област REGION Част от" (region header)
+# - "община MUNICIPALITY За индивидуална" (municipality header)
+# - "Част от LOCATION DD.MM.YYYY HH:MM DD.MM.YYYY HH:MM" (cut entry)
+# The headers are zero-width lookaheads so the "Част от" they end
+# with can still be matched as a cut entry on the same line.
+# Separators exclude newlines so no match spans two lines, and the lazy
+# name groups are length-bounded so a line that doesn't match gives up
+# after a fixed number of characters instead of scanning to its end.
+# Locations may contain digits (e.g. "ЖК ЛЮЛИН 5").
+_CUT_DETAILS_RE = re.compile(
+    r'(?=област (?P<region>[^\n]{1,80}?) Част от)'
+    r'|(?=община (?P<municipality>[^\n]{1,80}?) За индивидуална)'
+    r'|Част от (?P<location>[^\n]{1,200}?)[^\S\n]+'  # Location name
+    r'(?P<date_start>\d{2}\.\d{2}\.\d{4})[^\S\n]+'  # Start date
+    r'(?P<time_start>\d{2}:\d{2})[^\S\n]+'  # Start time
+    r'(?P<date_end>\d{2}\.\d{2}\.\d{4})[^\S\n]+'  # End date
+    r'(?P<time_end>\d{2}:\d{2})'  # End time
+)
+
+# Every line _CUT_DETAILS_RE can match contains one of these
+_CUT_MARKERS = ('Част от', 'област', 'община')
+
+
+class Cut(NamedTuple):
+    """
+    A planned cut entry parsed from a PDF.
+    """
+    location: str
+    date_start: str
+    time_start: str
+    date_end: str
+    time_end: str
+    region: Optional[str]
+    municipality: Optional[str]
+    # Uppercased once at parse time for case-insensitive city matching
+    location_upper: str
+    # Source line of the entry, only kept when DEBUG_CUTS is set
+    full_line: Optional[str] = None
+
+
+@functools.lru_cache(maxsize=32)
+def _city_pattern(city_name):
+    """
+    Compiles a case-insensitive literal pattern for a city name.
+
+    Args:
+        city_name: Name of the city to search for
+
+    Returns:
+        re.Pattern: Compiled pattern
+    """
+    return re.compile(re.escape(city_name), re.IGNORECASE)
+
+
+def _page_text(page, cut_blocks_only=False):
+    """
+    Extracts the text of a PyMuPDF page.
+
+    Args:
+        page: PyMuPDF page
+        cut_blocks_only: Keep only the text blocks _CUT_DETAILS_RE can match in
+
+    Returns:
+        str: Text of the page
+    """
+    if not cut_blocks_only:
+        return page.get_text("text")
+
+    # A block holds whole lines, so every line the cut regex matches is in
+    # a block containing one of its literals. Same order as "text" output.
+    return ''.join(
+        block[4] for block in page.get_text("blocks")
+        if block[6] == 0 and any(marker in block[4] for marker in _CUT_MARKERS)
+    )
+
+
+def _extract_page_range(pdf_path, start, stop, cut_blocks_only=False):
+    """
+    Extracts the text of a range of pages with PyMuPDF.
+
+    Runs in a worker process, which opens its own copy of the document.
+
+    Args:
+        pdf_path: Path to the PDF file
+        start: Index of the first page to extract
+        stop: Index one past the last page to extract
+        cut_blocks_only: Keep only the text blocks that can contain cut details
+
+    Returns:
+        list: Text of each page in the range, in page order
+    """
+    with pymupdf.open(pdf_path) as doc:
+        return [_page_text(doc[page_num], cut_blocks_only) for page_num in range(start, stop)]
 
 
 class PDFCutParser:
@@ -16,7 +141,45 @@ class PDFCutParser:
             pdf_path: Path to the PDF file to parse
         """
         self.pdf_path = pdf_path
-        self.text = None
+        self._text = _NOT_EXTRACTED
+        self._cut_text = _NOT_EXTRACTED
+
+    @property
+    def text(self):
+        """
+        Text content of the PDF, extracted on first access.
+
+        Extraction runs at most once per parser, even if it fails.
+
+        Returns:
+            str: Extracted text from all pages, or None if extraction failed
+        """
+        if self._text is _NOT_EXTRACTED:
+            self._text = self._do_extract()
+        return self._text
+
+    @property
+    def cut_text(self):
+        """
+        Text of the PDF that can contain cut details, extracted on first access.
+
+        With PyMuPDF only the text blocks containing region, municipality or
+        cut entry literals are kept, which is what extract_cut_details() scans.
+        Without it, or if the full text was already extracted, this is the
+        full text. A failed extraction here also counts as a failure for text.
+
+        Returns:
+            str: Extracted text, or None if extraction failed
+        """
+        if self._cut_text is _NOT_EXTRACTED:
+            if self._text is not _NOT_EXTRACTED or pymupdf is None:
+                self._cut_text = self.text
+            else:
+                self._cut_text = self._do_extract(cut_blocks_only=True)
+                if self._cut_text is None:
+                    # The file can't be read at all; don't try again for text
+                    self._text = None
+        return self._cut_text
 
     def extract_text(self):
         """
@@ -25,26 +188,79 @@ class PDFCutParser:
         Returns:
             str: Extracted text from all pages
         """
+        return self.text
+
+    def _do_extract(self, cut_blocks_only=False):
+        """
+        Reads the text of every page from the PDF file.
+
+        Uses PyMuPDF when installed and falls back to PyPDF2 otherwise.
+
+        Args:
+            cut_blocks_only: With PyMuPDF, keep only the text blocks that can
+                             contain cut details
+
+        Returns:
+            str: Extracted text from all pages, or None on error
+        """
         text_content = []
 
         try:
-            with open(self.pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                num_pages = len(pdf_reader.pages)
+            if pymupdf is not None:
+                with _PYMUPDF_LOCK:
+                    text_content = self._extract_pages_pymupdf(cut_blocks_only)
+            else:
+                with open(self.pdf_path, 'rb') as file:
+                    pdf_reader = PyPDF2.PdfReader(file)
+                    num_pages = len(pdf_reader.pages)
 
-                print(f"Reading {num_pages} pages from PDF...")
+                    logger.info("Reading %d pages from PDF...", num_pages)
 
-                for page_num in range(num_pages):
-                    page = pdf_reader.pages[page_num]
-                    text_content.append(page.extract_text())
+                    for page_num in range(num_pages):
+                        page = pdf_reader.pages[page_num]
+                        text_content.append(page.extract_text())
 
-            self.text = '\n'.join(text_content)
-            return self.text
+            return '\n'.join(text_content)
 
         except Exception as e:
-            print(f"Error extracting text from PDF: {e}")
+            logger.error("Error extracting text from PDF: %s", e)
             return None
 
+    def _extract_pages_pymupdf(self, cut_blocks_only=False):
+        """
+        Extracts the text of every page with PyMuPDF.
+
+        Large documents are split into contiguous page ranges that are
+        extracted in parallel by worker processes.
+
+        Args:
+            cut_blocks_only: Keep only the text blocks that can contain cut details
+
+        Returns:
+            list: Text of each page, in page order
+        """
+        with pymupdf.open(self.pdf_path) as doc:
+            num_pages = doc.page_count
+            logger.info("Reading %d pages from PDF...", num_pages)
+
+            workers = min(os.cpu_count() or 1, num_pages)
+            if num_pages < _PARALLEL_MIN_PAGES or workers < 2:
+                return [_page_text(page, cut_blocks_only) for page in doc]
+
+        step = -(-num_pages // workers)
+        starts = range(0, num_pages, step)
+        stops = [min(start + step, num_pages) for start in starts]
+
+        # spawn: forking a process that runs download threads is unsafe
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=len(starts), mp_context=context) as executor:
+            chunks = executor.map(
+                _extract_page_range,
+                [self.pdf_path] * len(starts), starts, stops,
+                [cut_blocks_only] * len(starts)
+            )
+            return [text for chunk in chunks for text in chunk]
+
     def search_city(self, city_name):
         """
         Searches for a specific city in the PDF text.
@@ -56,17 +272,15 @@ class PDFCutParser:
             list: List of dictionaries with match details
                   [{'text': '...', 'line_number': 10}]
         """
-        if not self.text:
-            self.extract_text()
-
-        if not self.text:
+        text = self.text
+        if not text:
             return []
 
         matches = []
-        lines = self.text.split('\n')
+        lines = text.split('\n')
 
         # Search case-insensitive
-        pattern = re.compile(re.escape(city_name), re.IGNORECASE)
+        pattern = _city_pattern(city_name)
 
         for i, line in enumerate(lines, 1):
             if pattern.search(line):
@@ -77,7 +291,7 @@ class PDFCutParser:
 
         return matches
 
-    def extract_cut_details(self):
+    def extract_cut_details(self, city_filter=None):
         """
         Extracts structured information about planned cuts.
 
@@ -87,68 +301,69 @@ class PDFCutParser:
         - Location/city (населено място)
         - Date and time intervals (DD.MM.YYYY HH:MM)
 
+        Args:
+            city_filter: Optional list of city names. Entries whose location
+                         doesn't contain any of them (case-insensitive
+                         substring) are skipped before being built.
+
         Returns:
-            list: List of cut entries with structured details
-                  [{'location': 'СОФИЯ', 'start': '08:30', 'end': '16:30',
-                    'date_start': '18.11.2025', 'date_end': '18.11.2025',
-                    'region': 'СОФИЯ', 'municipality': 'СОФИЯ'}]
+            list: List of Cut entries with structured details
+                  [Cut(location='СОФИЯ', date_start='18.11.2025', time_start='08:30',
+                       date_end='18.11.2025', time_end='16:30',
+                       region='СОФИЯ', municipality='СОФИЯ', ...)]
         """
-        if not self.text:
-            self.extract_text()
-
-        if not self.text:
+        text = self.cut_text
+        if not text:
             return []
 
         cuts = []
-        lines = self.text.split('\n')
-
-        # Pattern to match cut entries:
-        # "Част от LOCATION DD.MM.YYYY HH:MM DD.MM.YYYY HH:MM"
-        cut_pattern = re.compile(
-            r'Част от (.+?)\s+'  # Location name
-            r'(\d{2}\.\d{2}\.\d{4})\s+'  # Start date
-            r'(\d{2}:\d{2})\s+'  # Start time
-            r'(\d{2}\.\d{2}\.\d{4})\s+'  # End date
-            r'(\d{2}:\d{2})'  # End time
-        )
+        cities_upper = tuple({city.upper() for city in city_filter}) if city_filter else ()
 
         # Track current region and municipality as we parse
         current_region = None
         current_municipality = None
 
-        region_pattern = re.compile(r'област (.+?) Част от')
-        municipality_pattern = re.compile(r'община (.+?) За индивидуална')
-
-        for line in lines:
-            # Check for region
-            region_match = region_pattern.search(line)
-            if region_match:
-                current_region = region_match.group(1).strip()
-
-            # Check for municipality
-            muni_match = municipality_pattern.search(line)
-            if muni_match:
-                current_municipality = muni_match.group(1).strip()
-
-            # Check for cut entry
-            cut_match = cut_pattern.search(line)
-            if cut_match:
-                location = cut_match.group(1).strip()
-                date_start = cut_match.group(2)
-                time_start = cut_match.group(3)
-                date_end = cut_match.group(4)
-                time_end = cut_match.group(5)
-
-                cuts.append({
-                    'location': location,
-                    'date_start': date_start,
-                    'time_start': time_start,
-                    'date_end': date_end,
-                    'time_end': time_end,
-                    'region': current_region,
-                    'municipality': current_municipality,
-                    'full_line': line.strip()
-                })
+        # Only a handful of distinct names and dates repeat across all
+        # entries, so every entry shares one string object per value
+        pool = {}
+
+        def shared(value):
+            return pool.setdefault(value, value)
+
+        # The source lines are only needed when debugging the parser
+        keep_lines = bool(os.getenv('DEBUG_CUTS'))
+
+        for match in _CUT_DETAILS_RE.finditer(text):
+            if match.group('region') is not None:
+                current_region = shared(match.group('region').strip())
+            elif match.group('municipality') is not None:
+                current_municipality = shared(match.group('municipality').strip())
+            else:
+                location = match.group('location').strip()
+                # Interned because the same settlement names repeat across dates
+                location_upper = sys.intern(location.upper())
+                if cities_upper and not any(city in location_upper for city in cities_upper):
+                    continue
+
+                full_line = None
+                if keep_lines:
+                    line_start = text.rfind('\n', 0, match.start()) + 1
+                    line_end = text.find('\n', match.end())
+                    if line_end == -1:
+                        line_end = len(text)
+                    full_line = text[line_start:line_end].strip()
+
+                cuts.append(Cut(
+                    location=shared(location),
+                    date_start=shared(match.group('date_start')),
+                    time_start=shared(match.group('time_start')),
+                    date_end=shared(match.group('date_end')),
+                    time_end=shared(match.group('time_end')),
+                    region=current_region,
+                    municipality=current_municipality,
+                    location_upper=location_upper,
+                    full_line=full_line
+                ))
 
         return cuts
 
@@ -159,8 +374,6 @@ class PDFCutParser:
         Returns:
             str: Complete text from PDF
         """
-        if not self.text:
-            self.extract_text()
         return self.text
 
 
@@ -168,7 +381,7 @@ def main():
     """
     Demo function to test PDF parsing.
     """
-    import sys
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
 
     if len(sys.argv) < 2:
         print("Usage: python pdf_parser.py <pdf_file> [city_name]")
@@ -206,11 +419,11 @@ def main():
         if cuts:
             print(f"Found {len(cuts)} planned cut entries:\n")
             for i, cut in enumerate(cuts[:10], 1):  # Show first 10
-                print(f"{i}. Location: {cut['location']}")
-                print(f"   Region: {cut['region']}")
-                print(f"   Municipality: {cut['municipality']}")
-                print(f"   Time: {cut['date_start']} {cut['time_start']} - "
-                      f"{cut['date_end']} {cut['time_end']}")
+                print(f"{i}. Location: {cut.location}")
+                print(f"   Region: {cut.region}")
+                print(f"   Municipality: {cut.municipality}")
+                print(f"   Time: {cut.date_start} {cut.time_start} - "
+                      f"{cut.date_end} {cut.time_end}")
                 print()
 
             if len(cuts) > 10:
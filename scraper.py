@@ -1,8 +1,95 @@
-import requests
-from bs4 import BeautifulSoup
+import httpx
 from datetime import datetime
+import codecs
+import html
+import os
 import re
 import json
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
+
+# Bytes written per chunk when streaming PDFs to disk
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _class_token_re(token):
+    """
+    Builds a pattern matching a class attribute that contains a class token.
+
+    Matches the token as a whole whitespace-separated word of a quoted
+    value, or as an unquoted value, like BeautifulSoup's class_ filter.
+
+    Args:
+        token: Class name as bytes
+
+    Returns:
+        bytes: Regex source for the attribute
+    """
+    token = re.escape(token)
+    return (
+        rb'\bclass\s*=\s*(?:["\'](?:[^"\']*\s)?' + token + rb'(?=[\s"\'])'
+        rb'|' + token + rb'(?=[\s>]))'
+    )
+
+
+# The listing is only scanned for a few fields, so it is matched with
+# regexes over the raw bytes instead of being parsed into a DOM.
+# An item ends at its closing tag, or at the next item if the tag is omitted.
+_LIST_ITEM_RE = re.compile(
+    rb'<li\b[^>]*' + _class_token_re(b'list-group-item') + rb'[^>]*>'
+    rb'(.*?)(?=</li>|<li\b|</[ou]l>|$)',
+    re.DOTALL | re.IGNORECASE
+)
+_LINK_RE = re.compile(rb'<a\b([^>]*)>(.*?)</a>', re.DOTALL | re.IGNORECASE)
+_DOC_ID_RE = re.compile(rb'\bhref\s*=\s*["\']?[^"\'\s>]*previewdoc\((\d+)\)', re.IGNORECASE)
+_BADGE_RE = re.compile(
+    rb'<span\b[^>]*' + _class_token_re(b'badge') + rb'[^>]*>(.*?)</span>',
+    re.DOTALL | re.IGNORECASE
+)
+_TAG_RE = re.compile(rb'<[^>]*>')
+# <meta charset="..."> or <meta http-equiv="Content-Type" content="...; charset=...">
+_META_CHARSET_RE = re.compile(rb'<meta\b[^>]*\bcharset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+
+def _sniff_encoding(content):
+    """
+    Detects the charset of an HTML body without a charset in its Content-Type.
+
+    Args:
+        content: Raw HTML content
+
+    Returns:
+        str: Charset declared in a <meta> tag, or 'utf-8' if there is none
+    """
+    match = _META_CHARSET_RE.search(content[:4096])
+    if match:
+        encoding = match.group(1).decode('ascii')
+        try:
+            codecs.lookup(encoding)
+            return encoding
+        except LookupError:
+            pass
+    return 'utf-8'
+
+
+def _element_text(fragment, encoding='utf-8'):
+    """
+    Converts an HTML fragment to its text, like BeautifulSoup's get_text(strip=True).
+
+    Args:
+        fragment: HTML fragment as bytes
+        encoding: Charset of the page the fragment comes from
+
+    Returns:
+        str: Text of the fragment with tags removed and entities decoded
+    """
+    return ''.join(
+        html.unescape(part.decode(encoding, errors='replace')).strip()
+        for part in _TAG_RE.split(fragment)
+    )
+
 
 class ElectricityCutScraper:
     """
@@ -12,39 +99,138 @@ class ElectricityCutScraper:
     Each day has its own PDF file with the schedule.
     """
 
-    def __init__(self):
+    def __init__(self, state_file=None):
+        """
+        Initialize the scraper.
+
+        Args:
+            state_file: Optional JSON file remembering the last document listing
+                        and its cache validators, so unchanged listings aren't
+                        downloaded again
+        """
+        self.state_file = state_file
+        self.state = self.load_state()
+        # Validators of the last listing response, saved with its documents
+        self._validators = {}
         self.base_url = "https://info.ermzapad.bg"
         self.cuts_url = f"{self.base_url}/webint/vok/avplan.php?PLAN=FYI"
-        self.session = requests.Session()
-        # Set headers to mimic a real browser
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        # HTTP/2 multiplexes the listing and concurrent PDF downloads over
+        # one TLS connection; the pool is sized for the download threads
+        self.session = httpx.Client(
+            http2=True,
+            # Set headers to mimic a real browser
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            },
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+            # Like requests, follow redirects instead of failing on a 3xx
+            follow_redirects=True,
+            # Charset for responses whose Content-Type doesn't declare one
+            default_encoding=_sniff_encoding
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes the HTTP client and its pooled connections.
+        """
+        self.session.close()
+
+    def load_state(self):
+        """
+        Loads the listing state saved by a previous run.
+
+        Returns:
+            dict: Saved state with 'etag', 'last_modified' and 'documents',
+                  or an empty dict if there is none
+        """
+        if not self.state_file:
+            return {}
+
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable scraper state %s: %s", self.state_file, e)
+            return {}
+
+        # Valid JSON can still be a corrupt or foreign file
+        if not isinstance(state, dict) or not isinstance(state.get('documents', []), list):
+            logger.warning("Ignoring unreadable scraper state %s: unexpected format", self.state_file)
+            return {}
+
+        return state
+
+    def save_state(self, documents):
+        """
+        Saves the document listing together with the validators it was served with.
+
+        Args:
+            documents: Document list extracted from the listing
+        """
+        if not self.state_file or not self._validators:
+            return
+
+        self.state = {**self._validators, 'documents': documents}
+        try:
+            with open(self.state_file, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning("Could not write scraper state %s: %s", self.state_file, e)
 
     def fetch_page(self):
         """
         Fetches the main page with the list of planned cuts.
 
         The website loads data via AJAX POST request to avplan.php
-        with action=showpdf parameter.
+        with action=showpdf parameter. If a previous listing was saved with
+        cache validators, the request is made conditional on it having changed.
 
         Returns:
-            BeautifulSoup object: Parsed HTML content
+            httpx.Response: Listing response, or None if the listing is unchanged
         """
         ajax_url = f"{self.base_url}/webint/vok/avplan.php"
-        print(f"Fetching data via AJAX: {ajax_url}")
+        logger.info("Fetching data via AJAX: %s", ajax_url)
 
         # Make the same AJAX POST request that the JavaScript does
-        response = self.session.post(ajax_url, data={'action': 'showpdf'})
+        headers = {}
+        if isinstance(self.state.get('documents'), list):
+            if self.state.get('etag'):
+                headers['If-None-Match'] = self.state['etag']
+            if self.state.get('last_modified'):
+                headers['If-Modified-Since'] = self.state['last_modified']
+
+        response = self.session.post(ajax_url, data={'action': 'showpdf'}, headers=headers)
+        # Only a conditional request can be answered with the saved list.
+        # The listing is a POST, and a server following RFC 9110 answers a
+        # matching If-None-Match on a POST with 412 instead of 304.
+        if response.status_code in (304, 412) and headers:
+            return None
         response.raise_for_status()  # Raise error if request failed
-        return BeautifulSoup(response.content, 'html.parser')
 
-    def extract_document_list(self, soup):
+        self._validators = {
+            key: value for key, value in (
+                ('etag', response.headers.get('ETag')),
+                ('last_modified', response.headers.get('Last-Modified')),
+            ) if value
+        }
+        return response
+
+    def extract_document_list(self, html_content, encoding='utf-8'):
         """
         Extracts the list of PDF documents from the page.
 
         Args:
-            soup: BeautifulSoup object of the page
+            html_content: Raw HTML of the page from fetch_page()
+            encoding: Charset of the page (response.encoding)
 
         Returns:
             list: List of dictionaries containing document info
@@ -52,27 +238,25 @@ class ElectricityCutScraper:
         """
         documents = []
 
-        # Find the ordered list containing the documents
-        list_items = soup.find_all('li', class_='list-group-item')
+        for item in _LIST_ITEM_RE.finditer(html_content):
+            item_html = item.group(1)
 
-        for item in list_items:
             # Extract the link with document ID
-            link = item.find('a')
+            link = _LINK_RE.search(item_html)
             if not link:
                 continue
 
             # Extract document ID from href="javascript:previewdoc(1480);"
-            href = link.get('href', '')
-            doc_id_match = re.search(r'previewdoc\((\d+)\)', href)
+            doc_id_match = _DOC_ID_RE.search(link.group(1))
             if not doc_id_match:
                 continue
 
-            doc_id = doc_id_match.group(1)
-            title = link.get_text(strip=True)
+            doc_id = doc_id_match.group(1).decode('ascii')
+            title = _element_text(link.group(2), encoding)
 
             # Extract date from badge
-            badge = item.find('span', class_='badge')
-            date_str = badge.get_text(strip=True) if badge else None
+            badge = _BADGE_RE.search(item_html)
+            date_str = _element_text(badge.group(1), encoding) if badge else None
 
             documents.append({
                 'doc_id': doc_id,
@@ -97,25 +281,38 @@ class ElectricityCutScraper:
             bool: True if successful, False otherwise
         """
         ajax_url = f"{self.base_url}/webint/vok/avplan.php"
+        # Write next to the target and rename when complete, so an
+        # interrupted download never leaves a truncated PDF behind
+        partial_path = f"{output_path}.part"
 
         try:
-            print(f"Downloading PDF ID: {doc_id}")
-            # Make POST request with document ID
-            response = self.session.post(
+            logger.info("Downloading PDF ID: %s", doc_id)
+            # Make POST request with document ID. PDFs are already compressed,
+            # so ask for them as-is and stream them to disk as they arrive.
+            with self.session.stream(
+                'POST',
                 ajax_url,
-                data={'action': 'showdocid', 'doc_id': doc_id}
-            )
-            response.raise_for_status()
+                data={'action': 'showdocid', 'doc_id': doc_id},
+                headers={'Accept-Encoding': 'identity'}
+            ) as response:
+                response.raise_for_status()
 
-            # Save the PDF content
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
+                with open(partial_path, 'wb') as f:
+                    for chunk in response.iter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                os.replace(partial_path, output_path)
 
-            print(f"Saved PDF to: {output_path}")
+            logger.info("Saved PDF to: %s", output_path)
             return True
         except Exception as e:
-            print(f"Error downloading PDF {doc_id}: {e}")
+            logger.error("Error downloading PDF %s: %s", doc_id, e)
             return False
+        finally:
+            # Only still there if the download failed before the rename
+            try:
+                os.remove(partial_path)
+            except FileNotFoundError:
+                pass
 
     def get_latest_cuts(self, days=7):
         """
@@ -127,8 +324,13 @@ class ElectricityCutScraper:
         Returns:
             list: List of documents for the specified period
         """
-        soup = self.fetch_page()
-        all_docs = self.extract_document_list(soup)
+        response = self.fetch_page()
+        if response is None:
+            logger.info("Document listing unchanged, using the saved list")
+            all_docs = self.state['documents']
+        else:
+            all_docs = self.extract_document_list(response.content, response.encoding)
+            self.save_state(all_docs)
 
         # Return only the most recent documents (they're ordered by date)
         return all_docs[:days]
@@ -138,30 +340,33 @@ def main():
     """
     Main function to demonstrate the scraper.
     """
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    # httpx logs every request at INFO
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
     print("=" * 50)
     print("Electricity Cut Scraper - ERMZapad")
     print("=" * 50)
 
-    scraper = ElectricityCutScraper()
-
-    # Get the latest cuts
-    cuts = scraper.get_latest_cuts(days=3)
-
-    print(f"\nFound {len(cuts)} scheduled cut announcements:")
-    print("-" * 50)
-
-    for i, doc in enumerate(cuts, 1):
-        print(f"{i}. Date: {doc['date']}")
-        print(f"   Title: {doc['title']}")
-        print(f"   Document ID: {doc['doc_id']}")
-        print()
-
-    # Download the latest PDF as example
-    if cuts:
-        latest = cuts[0]
-        output_file = f"cuts_{latest['date'].replace('.', '-')}.pdf"
-        print(f"Downloading latest document...")
-        scraper.download_pdf(latest['doc_id'], output_file)
+    with ElectricityCutScraper() as scraper:
+        # Get the latest cuts
+        cuts = scraper.get_latest_cuts(days=3)
+
+        print(f"\nFound {len(cuts)} scheduled cut announcements:")
+        print("-" * 50)
+
+        for i, doc in enumerate(cuts, 1):
+            print(f"{i}. Date: {doc['date']}")
+            print(f"   Title: {doc['title']}")
+            print(f"   Document ID: {doc['doc_id']}")
+            print()
+
+        # Download the latest PDF as example
+        if cuts:
+            latest = cuts[0]
+            output_file = f"cuts_{latest['date'].replace('.', '-')}.pdf"
+            print(f"Downloading latest document...")
+            scraper.download_pdf(latest['doc_id'], output_file)
 
 
 if __name__ == "__main__":